@@ -1,6 +1,50 @@
-from collections import defaultdict
-from datetime import datetime, timedelta
-import re
+import sys
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# days before the first of each month in a non-leap year, indexed by month
+_MONTH_OFFSETS = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# book size above which the vectorized birthday prefilter pays off
+_VECTOR_THRESHOLD = 100
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _ordinal(year, month, day):
+    prior = year - 1
+    return (365 * prior + prior // 4 - prior // 100 + prior // 400
+            + _MONTH_OFFSETS[month] + day + (month > 2 and _is_leap(year)))
+
+
+def _celebration_weekday(today_wd, delta_days):
+    bday_wd = (today_wd + delta_days) % 7
+    if today_wd == 0:
+        # on Monday, greet the just-passed weekend today and skip the
+        # upcoming one - it belongs to next Monday's run
+        if -2 <= delta_days <= -1:
+            return 0
+        if 0 <= delta_days <= 4:
+            return bday_wd
+        return None
+    if 0 <= delta_days <= 6:
+        return 0 if bday_wd >= 5 else bday_wd
+    return None
+
+
+# celebration weekday (or None) by [today weekday][delta_days + 2], delta in -2..6
+_WEEKDAY_REMAP = tuple(
+    tuple(_celebration_weekday(wd, delta) for delta in range(-2, 7))
+    for wd in range(7)
+)
 
 
 class Field:
@@ -15,17 +59,17 @@ class Name(Field):
     pass
 
 
-class Phone(Field):
-    def __init__(self, value):
-        if not re.match(r'^\d{10}$', value):
-            raise ValueError("Invalid phone number format")
-        super().__init__(value)
+def validate_phone(value):
+    if len(value) != 10 or not value.isdigit():
+        raise ValueError("Invalid phone number format")
 
 
 class Birthday(Field):
     def __init__(self, value):
+        if len(value) != 10 or value[2] != '-' or value[5] != '-':
+            raise ValueError("Invalid birthday format. Use 'DD-MM-YYYY'.")
         try:
-            datetime.strptime(value, "%d-%m-%Y")
+            self.date = date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
         except ValueError:
             raise ValueError("Invalid birthday format. Use 'DD-MM-YYYY'.")
         super().__init__(value)
@@ -34,24 +78,25 @@ class Birthday(Field):
 class Record:
     def __init__(self, name, birthday=None):
         self.name = Name(name)
-        self.phones = []
+        self.phones = {}
         self.birthday = Birthday(birthday) if birthday else None
+        self._phones_str_cache = None
 
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        validate_phone(phone)
+        self.phones[sys.intern(phone)] = None
+        self._phones_str_cache = None
 
     def remove_phone(self, phone):
-        self.phones = [p for p in self.phones if str(p) != phone]
+        self.phones.pop(phone, None)
+        self._phones_str_cache = None
 
     def edit_phone(self, old_phone, new_phone):
         self.remove_phone(old_phone)
         self.add_phone(new_phone)
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if str(p) == phone:
-                return p
-        return None
+        return phone if phone in self.phones else None
 
     def add_birthday(self, birthday):
         if not isinstance(birthday, Birthday):  
@@ -59,69 +104,134 @@ class Record:
         self.birthday = birthday
 
     def __str__(self):
-        phones_str = '; '.join(str(p) for p in self.phones)
-        birthday_str = f", birthday: {self.birthday}" if self.birthday else ""
+        if self._phones_str_cache is None:
+            self._phones_str_cache = '; '.join(self.phones)
+        phones_str = self._phones_str_cache
+        birthday_str = f", birthday: {self.birthday.value}" if self.birthday else ""
         return f"Contact name: {self.name.value}, phones: {phones_str}{birthday_str}"
 
 
 class AddressBook:
     def __init__(self):
-        self.data = {}
+        self.names = {}
+        self.phones = []
+        self.birthdays = []
+        self._row_names = []
+        self._bday_month_day = []
+        self._bday_packed = None
+
+    def _bday_cache_add(self, name, birthday):
+        self._bday_month_day.append((birthday.date.month * 32 + birthday.date.day, name))
+        self._bday_packed = None
+
+    def _bday_cache_discard(self, name):
+        self._bday_month_day = [entry for entry in self._bday_month_day if entry[1] != name]
+        self._bday_packed = None
+
+    def _bday_candidates(self, today_year, today_ord):
+        if self._bday_packed is None:
+            self._bday_packed = np.array([packed for packed, _ in self._bday_month_day], dtype=np.int32)
+        packed = self._bday_packed
+        month = packed >> 5
+        day = packed & 31
+        jan1_ord = date(today_year, 1, 1).toordinal()
+        ords = jan1_ord - 1 + np.take(_MONTH_OFFSETS, month) + day + ((month > 2) & _is_leap(today_year))
+        delta = ords - today_ord
+        year_len = np.where(month > 2,
+                            366 if _is_leap(today_year + 1) else 365,
+                            366 if _is_leap(today_year) else 365)
+        rolled = delta + year_len
+        mask = ((delta >= -2) & (delta < 7)) | ((rolled >= -2) & (rolled < 7))
+        return [self._bday_month_day[i] for i in np.nonzero(mask)[0]]
 
     def add_record(self, name, phone, birthday=None):
-        record = Record(name, birthday)
-        record.add_phone(phone)
-        self.data[name] = record
+        validate_phone(phone)
+        birthday = Birthday(birthday) if birthday else None
+        name = sys.intern(name)
+        if name in self.names:
+            self.delete(name)
+        self.names[name] = len(self._row_names)
+        self._row_names.append(name)
+        self.phones.append({sys.intern(phone): None})
+        self.birthdays.append(birthday)
+        if birthday:
+            self._bday_cache_add(name, birthday)
 
     def find(self, name):
-        return self.data.get(name)
-    
+        row = self.names.get(name)
+        if row is None:
+            return None
+        record = Record(name)
+        record.phones = self.phones[row]
+        record.birthday = self.birthdays[row]
+        return record
+
+    def add_birthday(self, name, birthday):
+        row = self.names.get(name)
+        if row is None:
+            raise KeyError(name)
+        if not isinstance(birthday, Birthday):
+            raise ValueError("Invalid birthday format. Use 'Birthday' object.")
+        self.birthdays[row] = birthday
+        self._bday_cache_discard(name)
+        self._bday_cache_add(name, birthday)
+
     def update_record(self, name, new_record):
-        if name in self.data:
-            self.data[name] = new_record
-        else:
+        row = self.names.get(name)
+        if row is None:
             raise KeyError(f"Contact not found: {name}")
+        self.phones[row] = new_record.phones
+        self.birthdays[row] = new_record.birthday
+        self._bday_cache_discard(name)
+        if new_record.birthday:
+            self._bday_cache_add(name, new_record.birthday)
 
     def delete(self, name):
-        if name in self.data:
-            del self.data[name]                
+        row = self.names.pop(name, None)
+        if row is None:
+            return
+        last = len(self._row_names) - 1
+        if row != last:
+            last_name = self._row_names[last]
+            self._row_names[row] = last_name
+            self.phones[row] = self.phones[last]
+            self.birthdays[row] = self.birthdays[last]
+            self.names[last_name] = row
+        self._row_names.pop()
+        self.phones.pop()
+        self.birthdays.pop()
+        self._bday_cache_discard(name)
 
     def get_birthdays_per_week(self):
-        birthdays_by_day = defaultdict(list)
-        today = datetime.today().date()
-        today_day = datetime.today().strftime("%A")
-
-        for name, record in self.data.items():
-            if record.birthday:              
-                birthday = datetime.strptime(record.birthday.value, "%d-%m-%Y").date()
-                birthday_this_year = birthday.replace(year=today.year) if record.birthday.value else None
-
-                if birthday_this_year < today:
-                    if ((birthday_this_year - today).days) > -3 and today_day not in ["Monday", "Sunday", "Saturday"]:
-                        birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-
-                delta_days = (birthday_this_year - today).days if birthday_this_year else None
-
-                if delta_days < 7 and delta_days >= -2:
-                    birthday_weekday = (today + timedelta(days=delta_days)).strftime("%A")
-                    if  delta_days is not None and delta_days < 7 and delta_days >= 0 and today_day not in ["Monday", 'Sunday', 'Saturday']:
-                        if birthday_weekday in ['Sunday', 'Saturday']:
-                            birthday_weekday = 'Monday'
-                    elif delta_days < 7 and delta_days > 5 and today_day == "Monday":
-                        continue
-                    elif delta_days >= -2 and delta_days <= 0 and today_day == "Monday":
-                        birthday_weekday = 'Monday'
-                    elif delta_days >= -1 and delta_days == 0 and today_day == "Sunday":
-                        birthday_weekday = 'Monday'
-                    elif delta_days == 0 and today_day == "Sunday":
-                        birthday_weekday = 'Monday'
-                else:
-                    continue
-
-                birthdays_by_day[birthday_weekday].append(name)
-
-        for day, names in birthdays_by_day.items():
-            print(f"{day}: {', '.join(names)}")
+        birthdays_by_day = {day: [] for day in WEEKDAY_NAMES}
+        today = date.today()
+        today_year = today.year
+        today_ord = today.toordinal()
+        today_wd = today.weekday()
+        remap = _WEEKDAY_REMAP[today_wd]
+
+        entries = self._bday_month_day
+        if np is not None and len(entries) >= _VECTOR_THRESHOLD:
+            entries = self._bday_candidates(today_year, today_ord)
+
+        for packed, name in entries:
+            month, day = divmod(packed, 32)
+            delta_days = _ordinal(today_year, month, day) - today_ord
+            if delta_days < -2:
+                delta_days += 366 if _is_leap(today_year + (month > 2)) else 365
+
+            if delta_days > 6:
+                continue
+            birthday_wd = remap[delta_days + 2]
+            if birthday_wd is None:
+                continue
+
+            birthdays_by_day[WEEKDAY_NAMES[birthday_wd]].append(name)
+
+        for day in WEEKDAY_NAMES:
+            names = birthdays_by_day[day]
+            if names:
+                print(f"{day}: {', '.join(names)}")
 
    
 def input_error(func):
@@ -140,9 +250,9 @@ def input_error(func):
 
 @input_error
 def parse_input(user_input):
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    cmd, _, rest = user_input.strip().partition(' ')
+    cmd = cmd.lower()
+    return (cmd, *map(sys.intern, rest.split())) if rest else (cmd,)
 
 
 @input_error
@@ -159,9 +269,11 @@ def change_contact(args, book):
     if len(args) != 2:
         return "Invalid command. Please provide a name and a new phone number."
     name, new_phone = args
+    validate_phone(new_phone)
     record = book.find(name)
     if record:
-        record.remove_phone(record.phones[0].value)
+        if record.phones:
+            record.remove_phone(next(iter(record.phones)))
         record.add_phone(new_phone)
         return "Contact updated."
     else:
@@ -175,7 +287,7 @@ def show_phone(args, book):
     name = args[0]
     record = book.find(name)
     if record:
-        return f"{record.name.value}: {', '.join(str(p.value) for p in record.phones)}"
+        return f"{record.name.value}: {', '.join(record.phones)}"
     else:
         return f"Contact not found: {name}"
 
@@ -184,9 +296,9 @@ def show_phone(args, book):
 def show_all(args, book):
     if args:
         return "Invalid command. 'all' command doesn't require additional arguments."
-    if book.data:
-        for name, record in book.data.items():
-            print(record)
+    if book.names:
+        for name in book.names:
+            print(book.find(name))
     else:
         return "No contacts found."
 
@@ -197,7 +309,7 @@ def add_birthday(args, book):
     name, birthday = args
     record = book.find(name)
     if record:
-        record.add_birthday(Birthday(birthday)) 
+        book.add_birthday(name, Birthday(birthday))
         return f"Birthday added for {name}."
     else:
         return f"Contact not found: {name}"
@@ -224,7 +336,37 @@ def show_birthdays(args, book):
     book.get_birthdays_per_week()
 
 
-def main():  
+def hello(args, book):
+    return "How can I help you?"
+
+
+EXIT_COMMANDS = frozenset({"close", "exit"})
+
+COMMANDS = {
+    "hello": hello,
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": show_birthdays,
+}
+
+
+def run_batch(stream, book):
+    for line in stream:
+        command, *args = parse_input(line)
+        if command in EXIT_COMMANDS:
+            break
+        handler = COMMANDS.get(command)
+        if handler:
+            result = handler(args, book)
+            if result:
+                print(result)
+
+
+def main():
     book = AddressBook()
     print("Welcome to the assistant bot!")
 
@@ -232,27 +374,17 @@ def main():
         user_input = input("Enter a command: ")
         command, *args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        if command in EXIT_COMMANDS:
             print("Goodbye!")
             break
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, book))
-        elif command == "change":
-            print(change_contact(args, book))
-        elif command == "phone":
-            print(show_phone(args, book))
-        elif command == "all":
-            print(show_all(args, book))
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-        elif command == "birthdays":
-            show_birthdays(args, book)
-        else:
+
+        handler = COMMANDS.get(command)
+        if handler is None:
             print("Invalid command.")
+            continue
+        result = handler(args, book)
+        if result:
+            print(result)
 
 
 if __name__ == "__main__":